@@ -32,8 +32,11 @@ _AUTHORS = [
     _Author("Geir Arne Hjelle", "geirarne@gmail.com", _date(2019, 4, 1), _date.max)
 ]
 
-__author__ = ", ".join(a.name for a in _AUTHORS if a.start <= _date.today() <= a.end)
-__contact__ = ", ".join(a.email for a in _AUTHORS if a.start <= _date.today() <= a.end)
+_TODAY = _date.today()
+_ACTIVE_AUTHORS = [a for a in _AUTHORS if a.start <= _TODAY <= a.end]
+
+__author__ = ", ".join(a.name for a in _ACTIVE_AUTHORS)
+__contact__ = ", ".join(a.email for a in _ACTIVE_AUTHORS)
 
 
 # Update doc with info about maintainers
@@ -47,10 +50,7 @@ def _update_doc(doc: str) -> str:
         The updated doc-string.
     """
     # Maintainers
-    maintainer_list = [
-        f"+ {a.name} <{a.email}>" for a in _AUTHORS if a.start <= _date.today() <= a.end
-    ]
-    maintainers = "\n".join(maintainer_list)
+    maintainers = "\n".join(f"+ {a.name} <{a.email}>" for a in _ACTIVE_AUTHORS)
 
     # Add to doc-string
     return doc.format(maintainers=maintainers, url=__url__)
@@ -9,7 +9,7 @@ import os.path
 import pathlib
 import re
 from datetime import date, datetime
-from typing import Any, Callable, Dict, List, Set, Tuple
+from typing import Any, Callable, Dict, List, Pattern, Set, Tuple
 
 # Third party imports
 import pyplugs
@@ -20,10 +20,18 @@ from pyconfs import _exceptions
 # Set up pyplugs plugins
 package, _, plugin = __name__.rpartition(".")
 convert = functools.partial(pyplugs.call, package, plugin)
+get = functools.partial(pyplugs.get, package, plugin)
 info = functools.partial(pyplugs.info, package, plugin)
 names = functools.partial(pyplugs.funcs, package, plugin)
 
 
+# Converter functions, resolved when first used by convert_to
+_DISPATCH: Dict[str, Callable[..., Any]] = {}
+
+# Default separators for conversion to collections
+_DEFAULT_SPLIT_RE = r"[\s,]+"
+_DEFAULT_ITEM_SPLIT_RE = r",\n?"
+
 # Mappings for conversion to booleans
 _BOOLEAN_STATES = {
     "0": False,
@@ -37,18 +45,73 @@ _BOOLEAN_STATES = {
 }
 
 
-def convert_to(dtype, value):
-    """Convert value to the given type"""
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str) -> Pattern[str]:
+    """Compile a regular expression, reusing the compiled pattern on later calls"""
+    return re.compile(pattern)
+
+
+def _str(value: Any) -> str:
+    """Convert value to a string, skipping the conversion for strings"""
+    return value if type(value) is str else str(value)
+
+
+def _split(value: str, split_re: str, max_split: int) -> List[str]:
+    """Split value into tokens using the given regular expression
+
+    The default separator, whitespace and commas, is handled by str.split
+    instead of the regular expression engine.
+    """
+    if split_re == _DEFAULT_SPLIT_RE and max_split == 0:
+        return value.replace(",", " ").split()
+
+    return _compiled(split_re).split(value, maxsplit=max_split)
+
+
+def _split_items(value: str, item_split_re: str, max_split: int) -> List[str]:
+    """Split value into dictionary items using the given regular expression
+
+    The default separator, commas optionally followed by a newline, is handled
+    by str.split instead of the regular expression engine.
+    """
+    if item_split_re == _DEFAULT_ITEM_SPLIT_RE and max_split == 0:
+        return [s[1:] if s.startswith("\n") else s for s in value.split(",")]
+
+    return _compiled(item_split_re).split(value, maxsplit=max_split)
+
+
+def _resolve(dtype: str) -> Callable[..., Any]:
+    """Look up the converter function for the given type and remember it"""
     try:
-        return convert(f"to_{dtype}", value=value)
+        func = _DISPATCH[dtype] = get(func=f"to_{dtype}")
     except pyplugs.UnknownPluginFunctionError:
         raise ValueError(f"Conversion to {dtype} is not supported")
 
+    return func
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value: str, format: str) -> datetime:
+    """Parse a datetime, reusing the result for repeated values"""
+    return datetime.strptime(value, format)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_path(value: str) -> pathlib.Path:
+    """Parse a path, reusing the result for repeated values"""
+    return pathlib.Path(value)
+
+
+def convert_to(dtype, value):
+    """Convert value to the given type"""
+    func = _DISPATCH.get(dtype) or _resolve(dtype)
+    return func(value)
+
 
 @pyplugs.register
 def to_str(value: str) -> str:
     """Convert value to a string"""
-    return str(value)
+    return _str(value)
 
 
 @pyplugs.register
@@ -66,24 +129,28 @@ def to_float(value: str) -> float:
 @pyplugs.register
 def to_bool(value: str) -> bool:
     """Convert value to a boolean"""
-    try:
-        return _BOOLEAN_STATES[str(value).lower()]
-    except KeyError:
+    if type(value) is bool:
+        return value
+
+    state = _BOOLEAN_STATES.get(_str(value).lower())
+    if state is None:
         raise _exceptions.ConversionError(
             f"Value {value!r} can not be converted to boolean"
-        ) from None
+        )
+
+    return state
 
 
 @pyplugs.register
 def to_date(value: str, format="%Y-%m-%d") -> date:
     """Convert value to a date"""
-    return datetime.strptime(str(value), format=format).date()
+    return _parse_datetime(_str(value), format).date()
 
 
 @pyplugs.register
 def to_datetime(value: str, format="%Y-%m-%d %H:%M:%S") -> datetime:
     """Convert value to a datetime"""
-    return datetime.strptime(str(value), format=format)
+    return _parse_datetime(_str(value), format)
 
 
 @pyplugs.register
@@ -93,34 +160,37 @@ def to_path(value: str) -> pathlib.Path:
     if "~" in value:
         value = os.path.expanduser(value)
 
-    return pathlib.Path(value)
+    return _parse_path(value)
 
 
 @pyplugs.register
 def to_list(
     value: str,
-    split_re: str = r"[\s,]+",
+    split_re: str = _DEFAULT_SPLIT_RE,
     converter: Callable[[str], Any] = str,
     max_split: int = 0,
 ) -> List[Any]:
     """Convert value to a list"""
-    return [
-        converter(s) for s in re.split(split_re, str(value), maxsplit=max_split) if s
-    ]
+    tokens = _split(_str(value), split_re, max_split)
+    if converter is str:
+        return list(filter(None, tokens))
+
+    return [converter(s) for s in tokens if s]
 
 
 @pyplugs.register
 def to_dict(
     value: str,
-    item_split_re: str = r",\n?",
+    item_split_re: str = _DEFAULT_ITEM_SPLIT_RE,
     key_value_split_re: str = r"[:]",
     converter: Callable[[str], Any] = str.strip,
     max_split: int = 0,
 ) -> Dict[str, Any]:
     """Convert value to a dictionary"""
+    key_value_split = _compiled(key_value_split_re).split
     items = [
-        re.split(key_value_split_re, s, maxsplit=1)
-        for s in re.split(item_split_re, str(value), maxsplit=max_split)
+        key_value_split(s, maxsplit=1)
+        for s in _split_items(_str(value), item_split_re, max_split)
         if s
     ]
     return {k: converter(v) for k, v in items}
@@ -129,24 +199,28 @@ def to_dict(
 @pyplugs.register
 def to_set(
     value: str,
-    split_re: str = r"[\s,]+",
+    split_re: str = _DEFAULT_SPLIT_RE,
     converter: Callable[[str], Any] = str,
     max_split: int = 0,
 ) -> Set[Any]:
     """Convert value to a set"""
-    return {
-        converter(s) for s in re.split(split_re, str(value), maxsplit=max_split) if s
-    }
+    tokens = _split(_str(value), split_re, max_split)
+    if converter is str:
+        return set(filter(None, tokens))
+
+    return {converter(s) for s in tokens if s}
 
 
 @pyplugs.register
 def to_tuple(
     value: str,
-    split_re: str = r"[\s,]+",
+    split_re: str = _DEFAULT_SPLIT_RE,
     converter: Callable[[str], Any] = str,
     max_split: int = 0,
 ) -> Tuple[Any, ...]:
     """Convert value to a tuple"""
-    return tuple(
-        converter(s) for s in re.split(split_re, str(value), maxsplit=max_split) if s
-    )
+    tokens = _split(_str(value), split_re, max_split)
+    if converter is str:
+        return tuple(filter(None, tokens))
+
+    return tuple(converter(s) for s in tokens if s)
@@ -1,8 +1,9 @@
 """Types that a configuration can be converted to"""
 
 # Standard library imports
+import functools
 import re
-from typing import Any, NamedTuple, Optional
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
 # Third party imports
 import pyplugs
@@ -10,6 +11,12 @@ import pyplugs
 # Find plugins in the current file
 PACKAGE, _, PLUGIN = __name__.rpartition(".")
 
+# Find the name of the offending field in NamedTuple error messages
+_FIELD_RE = re.compile(r"'([^']+)'$")
+
+# Find the name of the NamedTuple constructor in error messages
+_CONSTRUCTOR_RE = re.compile(r"^[\w.]*(__new__|<lambda>)\(\)")
+
 
 def add_to_class(cls):
     """Add all type converters as methods on the given class"""
@@ -29,12 +36,12 @@ def as_named_tuple(
     Any other fields that are supplied will be added to the named tuple in
     addition to the data in the configuration.
     """
-    tpl_data = {**self.data, **other_fields}
-    src_map = {k: None if k in self.data else f"{k}={v!r}" for k, v in tpl_data.items()}
+    tpl_data = {**self, **other_fields}
 
     # Create a NamedTuple template based on the current data in the Configuration
     if template is None:
-        template = NamedTuple(self.name, **{k: type(v) for k, v in tpl_data.items()})
+        fields = tuple((k, type(v)) for k, v in tpl_data.items())
+        template = _template(self.name, fields)
 
     # Use NamedTuple to validate fields
     try:
@@ -42,9 +49,9 @@ def as_named_tuple(
     except TypeError as err:
         # Rewrite the error message if fields are missing
         name = f"Configuration {self.name!r}"
-        message = re.sub(r"^[\w.]*(__new__|<lambda>)\(\)", name, err.args[0])
-        field = (re.findall(r"'([^']+)'$", message) or ["__no_field_found__"]).pop()
-        message += f" ({self._get_source_string(field, src_map.get(field))})"
+        message = _CONSTRUCTOR_RE.sub(name, err.args[0])
+        field = (_FIELD_RE.findall(message) or ["__no_field_found__"]).pop()
+        message += f" ({_get_source(self, field, tpl_data)})"
         err.args = (message, *err.args[1:])
         raise
 
@@ -67,8 +74,27 @@ def as_named_tuple(
                 f"Configuration {self.name} got {type(tpl_data[field]).__name__!r} "
                 f"type for field {field}. "
                 f"{template.__name__} requires {field_type.__name__!r} "
-                f"({self._get_source_string(field, src_map.get(field))})"
+                f"({_get_source(self, field, tpl_data)})"
             )
             raise TypeError(message)
 
     return tpl
+
+
+@functools.lru_cache(maxsize=256)
+def _template(name: str, fields: Tuple[Tuple[str, type], ...]) -> Any:
+    """Create a NamedTuple template, reusing it for repeated names and fields"""
+    return NamedTuple(name, **dict(fields))
+
+
+def _get_source(cfg, field: str, tpl_data: Dict[str, Any]) -> str:
+    """Describe the source of a field, used in error messages
+
+    Fields that are not part of the configuration are described by their value.
+    """
+    fallback = (
+        f"{field}={tpl_data[field]!r}"
+        if field in tpl_data and field not in cfg
+        else None
+    )
+    return cfg._get_source_string(field, fallback)
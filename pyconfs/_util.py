@@ -25,6 +25,9 @@ class FuturePackage:
         if self._package_obj is None:
             self._package_obj = self._import_package()
 
+            # Copy attributes so later lookups bypass __getattr__
+            self.__dict__.update({**vars(self._package_obj), **self.__dict__})
+
         return self._package_obj
 
     def __getattr__(self, key: str) -> Any:
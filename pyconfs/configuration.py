@@ -6,55 +6,74 @@ well.
 """
 
 # Standard library imports
-import functools
+import itertools
 import os
 import pathlib
+import sys
 import textwrap
 import warnings
-from collections import UserDict, UserList, UserString
+from collections import ChainMap, UserDict, UserList, UserString
 from datetime import date, datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 # PyConfs imports
 from pyconfs import _converters, _exceptions, _types, readers, writers
 
+# Marker for missing entries, used where None is a valid value
+_MISSING = object()
 
-def _dispatch_to(converter):
-    """Decorator for dispatching methods to converter functions
-
-    This outer closure stores the converter parameter.
-    """
-
-    def _decorator_dispatch_to(func):
-        """Decorate the given function"""
-
-        @functools.wraps(func)
-        def _wrapper_dispatch_to(self, key: str, **options):
-            """Call the converter function"""
-            return converter(value=func(self, key), **options)
-
-        return _wrapper_dispatch_to
-
-    return _decorator_dispatch_to
+# Types of values that are always stored as plain entries
+_SCALAR_TYPES = {bool, date, datetime, float, int, str, type(None)}
 
 
 class IsConfiguration:
     """Mixin used to identify Configuration objects"""
 
+    __slots__ = ()
+
     @property
     def is_list(self):
         """Report on whether the Configuration object is a ConfigurationList"""
-        return isinstance(self, UserList)
+        return isinstance(self, list)
+
+
+# Types of values that make a list nested
+_NESTED_TYPES = (dict, list, IsConfiguration)
 
 
-class Configuration(UserDict, IsConfiguration):
+class Configuration(dict, IsConfiguration):
     """Consistent handling of configuration formats
 
+    Entries are stored directly in the underlying dictionary, so that item and
+    attribute access do not go through Python-level wrappers.
+
     Credit: Originally written for `midgard.config.Configuration`.
             See https://github.com/kartverket/midgard
     """
 
-    __slots__ = ("data", "name", "vars", "_source")
+    __slots__ = (
+        "name",
+        "vars",
+        "_source",
+        "_parent",
+        "_keys_cache",
+        "_sources_cache",
+        "_name_prefix",
+        "_name_stem",
+    )
 
     def __init__(
         self, name: Optional[str] = None, _vars: Optional[Dict[str, str]] = None
@@ -64,6 +83,9 @@ class Configuration(UserDict, IsConfiguration):
         self.name = name
         self.vars = {} if _vars is None else _vars
         self._source = {}
+        self._parent = None
+        self._keys_cache = None
+        self._sources_cache = None
 
     @classmethod
     def from_dict(
@@ -82,14 +104,13 @@ class Configuration(UserDict, IsConfiguration):
         *,
         name: Optional[str] = None,
         encoding: str = "utf-8",
+        cache: bool = False,
         **reader_args: Any,
     ) -> "Configuration":
         """Create a Configuration from a file"""
-        file_path = pathlib.Path(file_path)
-
         cfg = cls(name=name)
         cfg.update_from_file(
-            file_path=file_path, file_format=file_format, **reader_args
+            file_path=file_path, file_format=file_format, cache=cache, **reader_args
         )
         return cfg
 
@@ -104,26 +125,98 @@ class Configuration(UserDict, IsConfiguration):
 
     def update_entry(self, key: str, value: Any, source: str = "") -> None:
         """Update one entry in configuration"""
-        name = key if self.name is None else f"{self.name}.{key}"
+        self._changed()
 
-        # Treat dicts as nested configurations
-        if isinstance(value, (dict, UserDict)):
-            self.data.setdefault(key, self.__class__(name=name, _vars=self.vars))
-            self.data[key].update_from_dict(value, source=source)
+        # Plain values can not be nested, so skip the isinstance checks
+        if type(value) not in _SCALAR_TYPES:
+            # Treat dicts as nested configurations
+            if isinstance(value, (dict, UserDict)):
+                self._section(key).update_from_dict(value, source=source)
+                return
 
-        # Treat lists with nested elements as configuration lists
-        elif isinstance(value, (list, UserList)) and _is_nested(value):
-            self.data.setdefault(key, ConfigurationList(name=name, _vars=self.vars))
-            self.data[key].update_from_list(value, source=source)
+            # Treat lists with nested elements as configuration lists
+            if isinstance(value, (list, UserList)) and _is_nested(value):
+                self._list_section(key).update_from_list(value, source=source)
+                return
 
-        else:
-            self.data[key] = value
-            self._source[key] = source
+        dict.__setitem__(self, key, value)
+        self._source[key] = source
 
     def update_from_dict(self, entries: Dict[str, Any], source: str = "") -> None:
-        """Update the configuration from a dictionary"""
+        """Update the configuration from a dictionary
+
+        Nested dictionaries are loaded level by level using an explicit stack
+        instead of recursive calls.
+        """
+        stack = [(self, entries)]
+        while stack:
+            cfg, entries = stack.pop()
+            stack.extend(cfg._update_level_from_dict(entries, source=source))
+
+    def _update_level_from_dict(
+        self, entries: Dict[str, Any], source: str
+    ) -> List[Tuple["Configuration", Dict[str, Any]]]:
+        """Update one level of the configuration from a dictionary
+
+        Consecutive plain values are added in bulk, while other values are
+        handled one at a time to keep the order of entries. Plain nested
+        dictionaries are not loaded, but returned together with their sections.
+        """
+        nested = []
+        plain_entries = {}
         for key, value in entries.items():
-            self.update_entry(key=key, value=value, source=source)
+            # Share key strings between configurations and with attribute names
+            if type(key) is str:
+                key = sys.intern(key)
+
+            value_type = type(value)
+            if value_type in _SCALAR_TYPES:
+                plain_entries[key] = value
+                continue
+
+            if plain_entries:
+                self._update_plain_entries(plain_entries, source=source)
+                plain_entries = {}
+            if value_type is dict:
+                nested.append((self._section(key), value))
+            else:
+                self.update_entry(key=key, value=value, source=source)
+
+        self._update_plain_entries(plain_entries, source=source)
+        return nested
+
+    def _section(self, key: str) -> "Configuration":
+        """Get the section with the given key, add an empty section if needed"""
+        section = dict.get(self, key)
+        if not isinstance(section, Configuration):
+            section = self._add_section(key, self.__class__)
+
+        return section
+
+    def _list_section(self, key: str) -> "ConfigurationList":
+        """Get the list with the given key, add an empty list if needed"""
+        section = dict.get(self, key)
+        if not isinstance(section, ConfigurationList):
+            section = self._add_section(key, ConfigurationList)
+
+        return section
+
+    def _add_section(self, key: str, section_class: type) -> Any:
+        """Add an empty section, replacing any value stored with the same key"""
+        name = key if self.name is None else self._name_prefix + str(key)
+        section = section_class(name=name, _vars=self.vars)
+        section._parent = self
+        dict.__setitem__(self, key, section)
+        self._source.pop(key, None)
+        self._changed()
+
+        return section
+
+    def _update_plain_entries(self, entries: Dict[str, Any], source: str) -> None:
+        """Add entries that are known to not be nested"""
+        self._changed()
+        dict.update(self, entries)
+        self._source.update(dict.fromkeys(entries, source))
 
     def update_from_config(
         self, key: str, config: IsConfiguration, source: str = ""
@@ -139,17 +232,17 @@ class Configuration(UserDict, IsConfiguration):
         """Update the configuration from environment variables"""
         converters = {} if converters is None else converters
 
-        # Apply prefix
-        env_paths = {f"{prefix}{k}": v for k, v in env_paths.items()}
-        converters = {f"{prefix}{k}": v for k, v in converters.items()}
-
         # Loop through the variables defined in the environment
-        for var in set(os.environ) & set(env_paths):
-            value = os.environ[var]
+        updates = []
+        for key, env_path in env_paths.items():
+            var = f"{prefix}{key}"
+            value = os.environ.get(var)
+            if value is None:
+                continue
 
             # Convert type of value
-            if var in converters:
-                converter = converters[var]
+            if key in converters:
+                converter = converters[key]
                 try:
                     if callable(converter):
                         value = converter(value)
@@ -164,30 +257,42 @@ class Configuration(UserDict, IsConfiguration):
                     )
                     break
 
-            # Walk down tree for given entry
-            entry = entry_tree = {}
-            *entry_path, entry_key = env_paths[var]
-            for key in entry_path:
-                entry = entry.setdefault(key, {})
-            entry[entry_key] = value
+            updates.append((env_path, value, f"{var} (environment variable)"))
 
-            # Update configuration with new entry
-            self.update_from_dict(entry_tree, source=f"{var} (environment variable)")
+        # Update configuration with new entries
+        self._update_paths(updates)
+
+    def _update_paths(self, updates: List[Tuple[Sequence[str], Any, str]]) -> None:
+        """Update entries given by their path down the configuration tree"""
+        for (*entry_path, entry_key), value, source in updates:
+            section = self
+            for key in entry_path:
+                section = section._section(key)
+            section.update_entry(entry_key, value, source=source)
 
     def update_from_file(
         self,
         file_path: Union[str, pathlib.Path],
         file_format: Optional[str] = None,
         encoding: str = "utf-8",
+        cache: bool = False,
         **reader_args: Any,
     ) -> None:
-        """Update the configuration from a file"""
-        file_path = pathlib.Path(file_path)
+        """Update the configuration from a file
+
+        Use cache=True to cache parsed files, they are then only read again when
+        the file changes.
+        """
+        if not isinstance(file_path, pathlib.Path):
+            file_path = pathlib.Path(file_path)
+        if not file_path.is_absolute():
+            file_path = file_path.resolve()
+
         file_format, entries = readers.from_file(
-            file_path=file_path, file_format=file_format, **reader_args
+            file_path=file_path, file_format=file_format, cache=cache, **reader_args
         )
         self.update_from_dict(
-            entries, source=f"{file_path.resolve()} ({file_format.upper()} reader)"
+            entries, source=f"{file_path} ({file_format.upper()} reader)"
         )
 
     def update_from_str(self, string: str, format: str, *, source=None) -> None:
@@ -202,31 +307,22 @@ class Configuration(UserDict, IsConfiguration):
     def get(self, key, default=None, strict=False):
         """Get a value from the configuration, allow nested keys"""
         if isinstance(key, list):
-            first_key, *tail_keys = key
-            value = self.get(first_key, default, strict=strict)
-            if tail_keys:
-                try:
-                    return value.get(list(tail_keys), default, strict=strict)
-                except AttributeError:
-                    if strict:
-                        raise KeyError(tail_keys)
-                    else:
-                        return default
-            else:
-                return value
+            return _get_nested(self, key, default=default, strict=strict)
         else:
             if strict:
-                return self.data[key]
+                return self[key]
             else:
                 return super().get(key, default)
 
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Dictionary of entries, kept for compatibility with UserDict"""
+        return self
+
     @property
     def name_stem(self) -> str:
         """Part of name after last dot"""
-        if self.name is None:
-            return ""
-
-        return self.name.rpartition(".")[-1]
+        return self._name_stem
 
     @property
     def section_items(self) -> List[Tuple[str, "Configuration"]]:
@@ -257,10 +353,9 @@ class Configuration(UserDict, IsConfiguration):
 
         Only actual sections are included, not top level entries.
         """
-        for section_name, section in self.data.items():
-            if isinstance(section, IsConfiguration):
-                for flattened_section in section._flatten_section():
-                    yield section_name, flattened_section
+        for section_name in self._keys()[1]:
+            for flattened_section in self[section_name]._flatten_section():
+                yield section_name, flattened_section
 
     def _flatten_section(self) -> List["Configuration"]:
         """Return configuration as a list of one configuration"""
@@ -272,9 +367,7 @@ class Configuration(UserDict, IsConfiguration):
 
         Only actual entries are included, not subsections.
         """
-        return [
-            (k, v) for k, v in self.data.items() if not isinstance(v, IsConfiguration)
-        ]
+        return [(k, self[k]) for k in self._keys()[0]]
 
     @property
     def entry_values(self) -> List[Any]:
@@ -282,7 +375,7 @@ class Configuration(UserDict, IsConfiguration):
 
         Only actual values are included, not subsections.
         """
-        return [v for v in self.data.values() if not isinstance(v, IsConfiguration)]
+        return [self[k] for k in self._keys()[0]]
 
     @property
     def entry_keys(self) -> List[str]:
@@ -290,7 +383,23 @@ class Configuration(UserDict, IsConfiguration):
 
         Only actual keys are included, not subsections.
         """
-        return [k for k, v in self.data.items() if not isinstance(v, IsConfiguration)]
+        return list(self._keys()[0])
+
+    def _keys(self) -> Tuple[List[str], List[str]]:
+        """Keys of entries and keys of sections, in order
+
+        The keys are cached until the configuration is changed.
+        """
+        if self._keys_cache is None:
+            entry_keys, section_keys = [], []
+            for key, value in self.items():
+                if isinstance(value, IsConfiguration):
+                    section_keys.append(key)
+                else:
+                    entry_keys.append(key)
+            self._keys_cache = (entry_keys, section_keys)
+
+        return self._keys_cache
 
     @property
     def leafs(self) -> List[Tuple["Configuration", str, Any]]:
@@ -309,29 +418,29 @@ class Configuration(UserDict, IsConfiguration):
 
     def _leafs(self) -> List[Tuple["Configuration", str, Any]]:
         """Generator of all keys and values, recursively including subsections"""
-        for key, value in self.data.items():
-            if isinstance(value, IsConfiguration):
-                yield from value._leafs()
-            else:
-                yield self, key, value
+        return _iter_leafs(self)
+
+    def _leaf_items(self) -> Iterable[Tuple[str, Any]]:
+        """Keys and values used when listing leafs"""
+        return self.items()
 
     @property
     def sources(self):
-        """List sources in configuration"""
-        src = set(self._source.values())
-        for section in self.sections:
-            src |= section.sources
+        """List sources in configuration
 
-        return src
+        Sources are cached for each section, until the section is changed.
+        """
+        return set(_cached_sources(self))
 
     def get_source(self, key):
         """List source for the given key"""
-        if key in self.entry_keys:
-            return self._source[key]
-        elif key in self.section_names:
-            return self[key].sources
-        else:
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
             raise KeyError(f"Unknown entry {key!r}")
+        elif isinstance(value, IsConfiguration):
+            return set(_cached_sources(value))
+        else:
+            return self._source[key]
 
     def _get_source_string(self, key: str, fallback: Optional[str] = None) -> str:
         """Format source or sources as a string, be lenient about missing keys"""
@@ -352,20 +461,21 @@ class Configuration(UserDict, IsConfiguration):
         **replace_vars: str,
     ) -> Any:
         """Replace values in an entry based on {} format strings"""
-        all_vars = Variables(**self.vars, **replace_vars, default=default)
-        value = (
-            textwrap.dedent(self.get(key, strict=True))
-            if dedent
-            else self.get(key, strict=True)
-        )
+        value = self.get(key, strict=True)
+        if dedent:
+            value = _dedent(value)
 
-        # Replace variables
-        try:
-            replaced = value.format_map(all_vars)
-        except AttributeError:
-            raise _exceptions.ConversionError(
-                f"Only strings can be replaced, not {type(value).__name__!r} "
-            ) from None
+        # Replace variables, strings without braces are not changed by format_map
+        if type(value) is str and "{" not in value and "}" not in value:
+            replaced = value
+        else:
+            all_vars = Variables.from_maps(replace_vars, self.vars, default=default)
+            try:
+                replaced = value.format_map(all_vars)
+            except AttributeError:
+                raise _exceptions.ConversionError(
+                    f"Only strings can be replaced, not {type(value).__name__!r} "
+                ) from None
 
         # Optionally convert value to a different data type
         if converter is None:
@@ -376,12 +486,18 @@ class Configuration(UserDict, IsConfiguration):
             return _converters.convert(f"to_{converter}", value=replaced)
 
     def as_dict(self, **other_fields: Any) -> Dict[str, Any]:
-        """Convert Configuration to a nested dictionary"""
-        dct_data = {**self.data, **other_fields}
-        return {
-            k: v.as_dict() if isinstance(v, IsConfiguration) else v
-            for k, v in dct_data.items()
-        }
+        """Convert Configuration to a nested dictionary
+
+        Entries are copied in bulk, only sections are converted one by one.
+        """
+        dct_data = dict(self)
+        for key in self._keys()[1]:
+            dct_data[key] = dct_data[key].as_dict()
+        for key, value in other_fields.items():
+            dct_data[key] = (
+                value.as_dict() if isinstance(value, IsConfiguration) else value
+            )
+        return dct_data
 
     def as_str(
         self,
@@ -394,16 +510,48 @@ class Configuration(UserDict, IsConfiguration):
     ) -> str:
         """Represent Configuration as a string, heavily inspired by TOML"""
         if format is not None:
-            return writers.as_str(format, config=self.as_dict(), **writer_args)
+            return writers.as_str(format, config=self, **writer_args)
 
-        lines = [] if self.name is None or skip_header else [f"[{self.name}]"]
-        for key, value in self.data.items():
-            if isinstance(value, IsConfiguration):
-                value_str = value.as_str(indent=indent, key_width=key_width)
-                lines.append("\n" + textwrap.indent(value_str, " " * indent))
+        return "\n".join(
+            self._as_str_lines(
+                "", indent=indent, key_width=key_width, skip_header=skip_header
+            )
+        )
+
+    def _as_str_lines(
+        self, prefix: str, *, indent: int, key_width: int, skip_header: bool
+    ) -> List[str]:
+        """Represent Configuration as a list of lines, each indented by prefix
+
+        Nested sections add their lines directly, so that each line is only
+        built and indented once.
+        """
+        lines = []
+        if self.name is not None and not skip_header:
+            lines.append(_indent_line(f"[{self.name}]", prefix))
+        section_prefix = prefix + " " * indent
+        for key, value in self.items():
+            if isinstance(value, Configuration):
+                lines.append("")
+                lines.extend(
+                    value._as_str_lines(
+                        section_prefix,
+                        indent=indent,
+                        key_width=key_width,
+                        skip_header=False,
+                    )
+                )
+            elif isinstance(value, IsConfiguration):
+                lines.append("")
+                lines.extend(
+                    value._as_str_lines(
+                        section_prefix, indent=indent, key_width=key_width
+                    )
+                )
             else:
-                lines.append(f"{key:<{key_width}} = {_repr_toml(value)}")
-        return "\n".join(lines)
+                line = f"{key:<{key_width}} = {_repr_toml(value)}"
+                lines.append(_indent_line(line, prefix))
+        return lines
 
     def as_file(
         self,
@@ -414,7 +562,7 @@ class Configuration(UserDict, IsConfiguration):
     ):
         """Write Configuration to a file"""
         writers.as_file(
-            config=self.as_dict(),
+            config=self,
             file_path=pathlib.Path(file_path),
             file_format=file_format,
             encoding=encoding,
@@ -426,95 +574,186 @@ class Configuration(UserDict, IsConfiguration):
     #
     def _get_value(self, key: str) -> Any:
         """Get single value, raise an error if key points to a Configuration object"""
-        value = self.data[key]
+        value = self[key]
+        if type(value) in _SCALAR_TYPES:
+            return value
+
         if isinstance(value, self.__class__):
             raise _exceptions.EntryError(f"{self.name}.{key!r} is a Configuration")
 
         return value
 
-    @_dispatch_to(_converters.to_str)
-    def to_str(self, key: str) -> str:
+    def to_str(self, key: str, **options: Any) -> str:
         """Convert entry to string"""
-        return self._get_value(key)
+        return _converters.to_str(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_int)
-    def to_int(self, key: str) -> int:
+    def to_int(self, key: str, **options: Any) -> int:
         """Convert entry to integer number"""
-        return self._get_value(key)
+        return _converters.to_int(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_float)
-    def to_float(self, key: str) -> float:
+    def to_float(self, key: str, **options: Any) -> float:
         """Convert entry to a floating point number"""
-        return self._get_value(key)
+        return _converters.to_float(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_bool)
-    def to_bool(self, key: str) -> bool:
+    def to_bool(self, key: str, **options: Any) -> bool:
         """Convert entry to a boolean"""
-        return self._get_value(key)
+        return _converters.to_bool(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_date)
-    def to_date(self, key: str) -> date:
+    def to_date(self, key: str, **options: Any) -> date:
         """Convert entry to a date"""
-        return self._get_value(key)
+        return _converters.to_date(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_datetime)
-    def to_datetime(self, key: str) -> datetime:
+    def to_datetime(self, key: str, **options: Any) -> datetime:
         """Convert entry to a datetime"""
-        return self._get_value(key)
+        return _converters.to_datetime(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_path)
-    def to_path(self, key: str) -> pathlib.Path:
+    def to_path(self, key: str, **options: Any) -> pathlib.Path:
         """Convert entry to a path"""
-        return self._get_value(key)
+        return _converters.to_path(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_list)
-    def to_list(self, key: str) -> List[Any]:
+    def to_list(self, key: str, **options: Any) -> List[Any]:
         """Convert entry to a list"""
-        return self._get_value(key)
+        return _converters.to_list(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_dict)
-    def to_dict(self, key: str) -> Dict[str, Any]:
+    def to_dict(self, key: str, **options: Any) -> Dict[str, Any]:
         """Convert entry to a dictionary"""
-        return self._get_value(key)
+        return _converters.to_dict(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_set)
-    def to_set(self, key: str) -> Set[Any]:
+    def to_set(self, key: str, **options: Any) -> Set[Any]:
         """Convert entry to a set"""
-        return self._get_value(key)
+        return _converters.to_set(self._get_value(key), **options)
 
-    @_dispatch_to(_converters.to_tuple)
     def to_tuple(self, key: str, **options: Any) -> Tuple[Any, ...]:
         """Convert entry to a tuple"""
-        return self._get_value(key)
+        return _converters.to_tuple(self._get_value(key), **options)
 
     #
     # Dunder methods
     #
     def __dir__(self) -> List[str]:
         """Add sections and entries to list of attributes"""
-        return list(super().__dir__()) + list(self.data.keys())
+        return list(super().__dir__()) + list(self.keys())
 
     def __getattr__(self, key: str) -> Union["Configuration", Any]:
         """Get sections and keys using attribute (dot) syntax"""
-        try:
-            return self[key]
-        except KeyError:
-            raise AttributeError(
-                f"Configuration {self.name} has no entry {key!r}"
-            ) from None
+        value = dict.get(self, key, _MISSING)
+        if value is _MISSING:
+            if key in Configuration.__slots__:
+                # Regular attributes that are not set yet, for instance when copying
+                raise AttributeError(key)
+            raise AttributeError(f"Configuration {self.name} has no entry {key!r}")
+
+        return value
 
     def __setattr__(self, key: str, value: Any) -> None:
         """Update an entry using assignment syntax on attributes"""
         if key in self.__slots__:
             # Update regular attributes as normal
             super().__setattr__(key, value)
+            if key == "name":
+                self._set_name_parts(value)
         else:
             self.update_entry(key=key, value=value)
 
+    def _set_name_parts(self, name: Optional[str]) -> None:
+        """Store the prefix used for names of sections, and the name stem"""
+        if name is None:
+            self._name_prefix = self._name_stem = ""
+        else:
+            self._name_prefix = f"{name}."
+            self._name_stem = str(name).rpartition(".")[-1]
+
+    def _changed(self) -> None:
+        """Forget cached keys and sources after the configuration is changed"""
+        self._keys_cache = None
+        _forget_sources(self)
+
     def __setitem__(self, key: str, value: Any) -> None:
         """Update an entry using assignment syntax on items"""
         self.update_entry(key=key, value=value)
 
+    def __delitem__(self, key: str) -> None:
+        """Remove an entry"""
+        self._changed()
+        super().__delitem__(key)
+
+    def pop(self, *args: Any) -> Any:
+        """Remove an entry and return its value"""
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        """Remove the last entry and return its key and value"""
+        self._changed()
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._changed()
+        super().clear()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Add an entry if it does not exist, treat dictionaries as sections"""
+        if key not in self:
+            self.update_entry(key=key, value=default)
+        return self[key]
+
+    def update(self, *args: Any, **entries: Any) -> None:
+        """Update entries, treat nested dictionaries as sections"""
+        self.update_from_dict(dict(*args, **entries))
+
+    def copy(self) -> "Configuration":
+        """Copy the configuration, including its sections and sources"""
+        return _copy_nested(self)
+
+    def __or__(self, other: Any) -> "Configuration":
+        """Copy the configuration and update it with other entries"""
+        if not isinstance(other, dict):
+            return NotImplemented
+
+        cfg = self.copy()
+        cfg.update(other)
+        return cfg
+
+    def __ror__(self, other: Any) -> "Configuration":
+        """Create a configuration from other entries, updated with this one"""
+        if not isinstance(other, dict):
+            return NotImplemented
+
+        cfg = self.__class__(name=self.name, _vars=self.vars)
+        cfg.update(other)
+        cfg.update(self)
+        return cfg
+
+    def __ior__(self, other: Any) -> "Configuration":
+        """Update the configuration with other entries"""
+        self.update(other)
+        return self
+
+    def __copy__(self) -> "Configuration":
+        """Copy the configuration, including its sections and sources"""
+        return self.copy()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the configuration with its attributes and entries"""
+        return (
+            self.__class__,
+            (),
+            (self.name, self.vars, self._source, dict(self)),
+        )
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restore attributes before entries, so that sources are kept
+
+        The entries are stored directly, as they are already wrapped in
+        sections.
+        """
+        self.name, self.vars, source, entries = state
+        dict.update(self, entries)
+        self._source.update(source)
+        _adopt_sections(self, entries.values())
+        self._changed()
+
     def __repr__(self):
         """Simple representation of a Configuration"""
         if self.name is None:
@@ -531,8 +770,14 @@ class Configuration(UserDict, IsConfiguration):
 _types.add_to_class(Configuration)
 
 
-class ConfigurationList(UserList, IsConfiguration):
-    """Collect a list of Configurations in one object"""
+class ConfigurationList(list, IsConfiguration):
+    """Collect a list of Configurations in one object
+
+    Entries are stored directly in the underlying list, so that item access and
+    iteration do not go through Python-level wrappers.
+    """
+
+    __slots__ = ("name", "vars", "_source", "_parent", "_sources_cache")
 
     def __init__(
         self, name: Optional[str] = None, _vars: Optional[Dict[str, str]] = None
@@ -542,6 +787,8 @@ class ConfigurationList(UserList, IsConfiguration):
         self.name = name
         self.vars = {} if _vars is None else _vars
         self._source = []
+        self._parent = None
+        self._sources_cache = None
 
     @classmethod
     def from_list(
@@ -568,30 +815,30 @@ class ConfigurationList(UserList, IsConfiguration):
             value_obj = value
 
         # Add entry to configuration list
-        self.data.append(value_obj)
+        if isinstance(value_obj, IsConfiguration):
+            value_obj._parent = self
+        list.append(self, value_obj)
         self._source.append(source)
+        _forget_sources(self)
 
     def update_from_list(self, entries: List[Any], source: str = "") -> None:
         """Update the configuration list from a list"""
         for entry in entries:
             self.update_entry(entry, source=source)
 
+    @property
+    def data(self) -> List[Any]:
+        """List of entries, kept for compatibility with UserList"""
+        return self
+
     def _flatten_section(self) -> List["Configuration"]:
         """Return configuration as a list of Configurations"""
-        return self.data
+        return self
 
     def get(self, key, default=None):
         """Get an entry from the ConfigurationList, allow nested keys"""
         if isinstance(key, list):
-            first_key, *tail_keys = key
-            value = self.get(first_key, default)
-            if tail_keys:
-                try:
-                    return value.get(list(tail_keys), default)
-                except AttributeError:
-                    return default
-            else:
-                return value
+            return _get_nested(self, key, default=default, strict=False)
         else:
             try:
                 return self[key]
@@ -615,37 +862,58 @@ class ConfigurationList(UserList, IsConfiguration):
 
     def _leafs(self) -> List[Tuple["Configuration", str, Any]]:
         """Generator of all keys and values, recursively including subsections"""
-        for value in self:
-            if isinstance(value, IsConfiguration):
-                yield from value._leafs()
-            else:
-                yield self, self.name, value
+        return _iter_leafs(self)
+
+    def _leaf_items(self) -> Iterable[Tuple[str, Any]]:
+        """Name and values used when listing leafs"""
+        return zip(itertools.repeat(self.name), self)
 
     def as_dict(self) -> List[Any]:
         """Convert ConfigurationList to a nested dictionary"""
-        return [v.as_dict() if isinstance(v, IsConfiguration) else v for v in self.data]
+        return [v.as_dict() if isinstance(v, IsConfiguration) else v for v in self]
 
     def as_str(self, *, indent: int = 2, key_width: int = 20) -> str:
         """Represent configuration list as a string"""
+        return "\n".join(self._as_str_lines("", indent=indent, key_width=key_width))
+
+    def _as_str_lines(self, prefix: str, *, indent: int, key_width: int) -> List[str]:
+        """Represent configuration list as a list of lines, each indented by prefix
+
+        Entries are separated by blank lines. Empty configurations and empty
+        lists are represented by a single blank line.
+        """
         lines = []
-        for value in self.data:
-            lines.append(f"\n[[{self.name}]]")
-            if isinstance(value, IsConfiguration):
-                value_str = value.as_str(
-                    indent=indent, key_width=key_width, skip_header=True
+        for value in self:
+            lines.append("")
+            lines.append(_indent_line(f"[[{self.name}]]", prefix))
+            if isinstance(value, Configuration):
+                value_lines = value._as_str_lines(
+                    prefix, indent=indent, key_width=key_width, skip_header=True
+                )
+                lines.extend(value_lines or [""])
+            elif isinstance(value, IsConfiguration):
+                lines.extend(
+                    value._as_str_lines(prefix, indent=indent, key_width=key_width)
                 )
-                lines.append(value_str)
             else:
-                lines.append(f"{_repr_toml(value)}")
-        return "\n".join(lines).strip()
+                lines.append(_indent_line(_repr_toml(value), prefix))
+
+        # Remove blank lines at the end, left by empty configurations
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines[1:] or [""]
 
     #
     # Dunder methods
     #
     def __getattr__(self, key: str) -> Union["ConfigurationList", Any]:
         """Include attributes available on all entries"""
+        if key in ConfigurationList.__slots__ or key.startswith("__"):
+            # Regular and special attributes that are not set, for instance when copying
+            raise AttributeError(key)
+
         try:
-            return self.from_list(getattr(entry, key) for entry in self.data)
+            return self.from_list(getattr(entry, key) for entry in self)
         except AttributeError:
             raise AttributeError(
                 f"{self.__class__.__name__!r} object has no attribute {key!r}"
@@ -657,13 +925,33 @@ class ConfigurationList(UserList, IsConfiguration):
             return super().__getitem__(key)
         except TypeError:
             try:
-                return self.from_list(entry[key] for entry in self.data)
+                return self.from_list(entry[key] for entry in self)
             except KeyError:
                 raise AttributeError(
                     f"All items in ConfigurationList {self.name} "
                     f"don't have entry {key!r}"
                 ) from None
 
+    def __copy__(self) -> "ConfigurationList":
+        """Copy the configuration list, including its sections and sources"""
+        return _copy_nested(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the configuration list with its attributes and entries"""
+        return (
+            self.__class__,
+            (),
+            (self.name, self.vars, self._source, list(self)),
+        )
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restore attributes before entries, so that sources are kept"""
+        self.name, self.vars, source, entries = state
+        list.extend(self, entries)
+        self._source.extend(source)
+        _adopt_sections(self, entries)
+        _forget_sources(self)
+
 
 class Variables(UserDict):
     """Dictionary that allows more flexible format style replacements
@@ -679,18 +967,55 @@ class Variables(UserDict):
 
     def __init__(self, default=None, **vars):
         """Store optional default value"""
+        self._resolved = {}
+        self._resolving = set()
         super().__init__(**vars)
         self.default = default
 
+    @classmethod
+    def from_maps(cls, *maps: Dict[str, Any], default=None) -> "Variables":
+        """Look up variables in the given dictionaries without copying them
+
+        Earlier dictionaries take precedence over later ones.
+        """
+        variables = cls(default=default)
+        variables.data = ChainMap(*maps)
+        return variables
+
     def __getitem__(self, key):
-        """Handle nested replacements"""
+        """Handle nested replacements
+
+        Replaced strings are remembered, so that each variable is only replaced
+        once. Variables that refer to themselves, directly or through other
+        variables, are left as they are.
+        """
+        if key in self._resolved:
+            return self._resolved[key]
+        if key in self._resolving:
+            return UnsetVariable(key)
+
         value = super().__getitem__(key)
 
         # Nested replacement for strings
-        if isinstance(value, str):
-            return value.format_map(self)
-        else:
-            return value
+        if isinstance(value, str) and ("{" in value or "}" in value):
+            self._resolving.add(key)
+            try:
+                value = value.format_map(self)
+            finally:
+                self._resolving.discard(key)
+
+        self._resolved[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        """Forget earlier replacements when variables change"""
+        self._resolved.clear()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        """Forget earlier replacements when variables change"""
+        self._resolved.clear()
+        super().__delitem__(key)
 
     def __missing__(self, key):
         """Handle missing variables"""
@@ -713,15 +1038,24 @@ class UnsetVariable(UserString):
 
 
 def _repr_toml(value: Any) -> str:
-    """Represent value as a TOML string"""
+    """Represent value as a TOML string
+
+    Common types are looked up in _TOML_REPR, other values are handled by
+    _repr_toml_any.
+    """
+    repr_func = _TOML_REPR.get(type(value))
+    if repr_func is None:
+        return _repr_toml_any(value)
+
+    return repr_func(value)
+
+
+def _repr_toml_any(value: Any) -> str:
+    """Represent value of any type as a TOML string"""
 
     # Use double quotes for strings
     if isinstance(value, str):
-        if "\n" in value:
-            # Use triple quotes for multi-line strings
-            return f'"""\n{value}"""'
-        else:
-            return f'"{value}"'
+        return _repr_toml_str(value)
 
     # Dates can be written using isoformat
     if isinstance(value, (date, datetime)):
@@ -729,15 +1063,201 @@ def _repr_toml(value: Any) -> str:
 
     # Bools should be written true and false
     if isinstance(value, bool):
-        return repr(value).lower()
+        return _repr_toml_bool(value)
 
     # Handle lists recursively
     if isinstance(value, (list, tuple)):
-        return f"[{', '.join(_repr_toml(v) for v in value)}]"
+        return _repr_toml_list(value)
 
     return str(value)
 
 
+def _repr_toml_str(value: str) -> str:
+    """Represent a string as a TOML string"""
+    if "\n" in value:
+        # Use triple quotes for multi-line strings
+        return f'"""\n{value}"""'
+    else:
+        return '"' + value + '"'
+
+
+def _repr_toml_bool(value: bool) -> str:
+    """Represent a boolean as a TOML string"""
+    return "true" if value else "false"
+
+
+def _repr_toml_list(value: Union[List[Any], Tuple[Any, ...]]) -> str:
+    """Represent a list or tuple as a TOML string"""
+    return f"[{', '.join(_repr_toml(v) for v in value)}]"
+
+
+# Functions representing values of common types as TOML strings
+_TOML_REPR: Dict[type, Callable[[Any], str]] = {
+    str: _repr_toml_str,
+    int: str,
+    float: str,
+    bool: _repr_toml_bool,
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    list: _repr_toml_list,
+    tuple: _repr_toml_list,
+}
+
+
+def _forget_sources(cfg: IsConfiguration) -> None:
+    """Forget cached sources of the configuration and of all its parents
+
+    When sources are cached for a configuration, they are cached for all its
+    sections as well. The walk can therefore stop at the first configuration
+    without cached sources.
+    """
+    while cfg is not None and cfg._sources_cache is not None:
+        cfg._sources_cache = None
+        cfg = cfg._parent
+
+
+def _cached_sources(cfg: IsConfiguration) -> FrozenSet[str]:
+    """Sources of all entries, cached for the configuration and all its sections
+
+    Sections without cached sources are found by walking down the tree, and
+    their sources are then calculated bottom-up, reusing what is already cached.
+    """
+    if cfg._sources_cache is not None:
+        return cfg._sources_cache
+
+    # Find configurations without cached sources, parents before children
+    uncached = []
+    stack = [cfg]
+    while stack:
+        section = stack.pop()
+        uncached.append(section)
+        stack.extend(s for s in _child_sections(section) if s._sources_cache is None)
+
+    # Combine sources of entries with sources of sections, children first
+    for section in reversed(uncached):
+        if isinstance(section, Configuration):
+            sources = set(section._source.values())
+        else:
+            sources = {
+                source
+                for value, source in zip(section, section._source)
+                if not isinstance(value, IsConfiguration)
+            }
+        for child in _child_sections(section):
+            sources |= child._sources_cache
+        section._sources_cache = frozenset(sources)
+
+    return cfg._sources_cache
+
+
+def _adopt_sections(cfg: IsConfiguration, values: Iterable[Any]) -> None:
+    """Make cfg the parent of all sections among the values"""
+    for value in values:
+        if isinstance(value, IsConfiguration):
+            value._parent = cfg
+
+
+def _copy_nested(cfg: IsConfiguration) -> IsConfiguration:
+    """Copy a configuration, nested configurations are copied as well
+
+    Entry values and variables are shared with the original configuration.
+    """
+    copied = cfg.__class__(name=cfg.name, _vars=cfg.vars)
+    if isinstance(cfg, Configuration):
+        for key, value in dict.items(cfg):
+            if isinstance(value, IsConfiguration):
+                value = _copy_nested(value)
+                value._parent = copied
+            dict.__setitem__(copied, key, value)
+        copied._source.update(cfg._source)
+    else:
+        for value in cfg:
+            if isinstance(value, IsConfiguration):
+                value = _copy_nested(value)
+                value._parent = copied
+            list.append(copied, value)
+        copied._source.extend(cfg._source)
+
+    return copied
+
+
+def _child_sections(cfg: IsConfiguration) -> List[IsConfiguration]:
+    """Sections and configuration lists directly inside the configuration"""
+    if isinstance(cfg, Configuration):
+        return [dict.__getitem__(cfg, key) for key in cfg._keys()[1]]
+    else:
+        return [value for value in cfg if isinstance(value, IsConfiguration)]
+
+
+def _dedent(text: str) -> str:
+    """Remove common leading whitespace, skip textwrap when no line is indented"""
+    if type(text) is str and not (
+        text.startswith((" ", "\t")) or "\n " in text or "\n\t" in text
+    ):
+        return text
+
+    return textwrap.dedent(text)
+
+
+def _indent_line(line: str, prefix: str) -> str:
+    """Add prefix to a line, use textwrap.indent if the line has line breaks"""
+    return prefix + line if line.isprintable() else textwrap.indent(line, prefix)
+
+
+def _get_nested(
+    cfg: IsConfiguration, keys: List[Any], default: Any, strict: bool
+) -> Any:
+    """Look up nested keys by walking down the configuration tree"""
+    value = cfg
+    for idx, key in enumerate(keys):
+        if isinstance(value, Configuration):
+            value = dict.get(value, key, _MISSING)
+        elif isinstance(value, ConfigurationList):
+            value = value.get(key, _MISSING)
+        elif strict:
+            raise KeyError(keys[idx:])
+        else:
+            return default
+
+        if value is _MISSING:
+            if strict:
+                raise KeyError(key)
+            return default
+
+    return value
+
+
+def _iter_leafs(
+    root: IsConfiguration,
+) -> Iterator[Tuple[IsConfiguration, str, Any]]:
+    """Generator of all keys and values, recursively including subsections
+
+    Uses an explicit stack instead of recursive generators, so that each leaf
+    is only passed through one generator frame.
+    """
+    stack = [(root, iter(root._leaf_items()))]
+    while stack:
+        cfg, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, IsConfiguration):
+                stack.append((value, iter(value._leaf_items())))
+                break
+
+            yield cfg, key, value
+        else:
+            stack.pop()
+
+
 def _is_nested(sequence) -> bool:
-    """Check if the sequence contains nested lists or dictionaries"""
-    return any(isinstance(s, (dict, list, IsConfiguration)) for s in sequence)
+    """Check if the sequence contains nested lists or dictionaries
+
+    Elements of plain types are skipped without doing any isinstance checks.
+    """
+    for element in sequence:
+        element_type = type(element)
+        if element_type in _SCALAR_TYPES:
+            continue
+        if isinstance(element, _NESTED_TYPES):
+            return True
+
+    return False
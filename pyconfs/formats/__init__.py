@@ -1,9 +1,10 @@
 """Support simple autodetection of file formats"""
 
 # Standard library imports
+import functools
 import json
 import pathlib
-from typing import Union
+from typing import Optional, Union
 
 # PyConfs imports
 from pyconfs._exceptions import UnknownFormat
@@ -23,16 +24,25 @@ FORMATS = {}
 
 def guess_format(file_path: Union[str, pathlib.Path]) -> str:
     """Guess the format of a file based on the file suffix"""
+    file_path = pathlib.Path(file_path)
+    format = _format_from_suffix(file_path.suffix)
+    if format is None:
+        raise UnknownFormat(f"Could not guess format of {file_path}")
+
+    return format
+
+
+@functools.lru_cache(maxsize=64)
+def _format_from_suffix(suffix: str) -> Optional[str]:
+    """Find the format using the given suffix, remember the result for later"""
     if not FORMATS:
         _read_formats()
 
-    file_path = pathlib.Path(file_path)
-    suffix = file_path.suffix
     for format, suffixes in FORMATS.items():
         if suffix in suffixes:
             return format
 
-    raise UnknownFormat(f"Could not guess format of {file_path}")
+    return None
 
 
 def _read_formats():
@@ -3,8 +3,12 @@
 """
 
 # Standard library imports
+import copy
+import functools
 import pathlib
-from typing import Any, Dict, Optional, Tuple
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # Third party imports
 import pyplugs
@@ -13,22 +17,114 @@ import pyplugs
 from pyconfs import formats
 
 names = pyplugs.names_factory(__package__)
-from_str = pyplugs.call_factory(__package__)
+get = pyplugs.get_factory(__package__)
+
+# Parsed files, keyed on path and read options. Each entry stores the size and
+# modification time of the file, the time it was read, and the parsed entries.
+# The least recently used files are dropped when the cache is full
+_CacheEntry = Tuple[Tuple[int, int], float, Dict[str, Any]]
+_FILE_CACHE: "OrderedDict[Tuple[Any, ...], _CacheEntry]" = OrderedDict()
+_FILE_CACHE_SIZE = 32
+
+# Formats that are parsed faster than cached entries can be copied
+_UNCACHED_FORMATS = {"json"}
+
+# Files modified this close to when they were read are always read again, as
+# file systems may not record modification times at a finer resolution
+_RACY_SECONDS = 2.0
+
+
+def from_str(
+    file_format: str, func: Optional[str] = None, **reader_args: Any
+) -> Dict[str, Any]:
+    """Read a configuration from a string with the given format
+
+    Use func to call another function than the default one in the reader plugin.
+    """
+    return _get_reader(file_format, func=func)(**reader_args)
 
 
 def from_file(
     file_path: pathlib.Path,
     file_format: Optional[str] = None,
     encoding: str = "utf-8",
+    cache: bool = False,
     **reader_args: Any
 ) -> Tuple[str, Dict[str, Any]]:
     """Read a configuration from file with the given format
 
     If the file format is not specified, it is deduced from the file path suffix.
+
+    Use cache=True to cache parsed files, so that they are only read again if
+    their size or modification time change. A copy of the cached entries is
+    returned, so that changes made by the caller do not affect the cache. Formats
+    that are faster to parse than to copy, like JSON, are never cached.
     """
     file_format = (
         formats.guess_format(file_path) if file_format is None else file_format
     )
-    return file_format, from_str(
-        file_format, string=file_path.read_text(encoding=encoding), **reader_args
+    if not cache or file_format in _UNCACHED_FORMATS:
+        return file_format, _read_file(file_path, file_format, encoding, reader_args)
+
+    file_stat = file_path.stat()
+    file_id = (file_stat.st_size, file_stat.st_mtime_ns)
+    cache_key = (
+        file_path.absolute(),
+        file_format,
+        encoding,
+        tuple(sorted(reader_args.items())),
     )
+    try:
+        cached_id, read_time, entries = _FILE_CACHE.get(cache_key, (None, 0, None))
+    except TypeError:
+        # Reader arguments that can not be hashed, skip the cache
+        return file_format, _read_file(file_path, file_format, encoding, reader_args)
+
+    if cached_id != file_id or read_time - file_stat.st_mtime < _RACY_SECONDS:
+        read_time = time.time()
+        entries = _read_file(file_path, file_format, encoding, reader_args)
+        _FILE_CACHE[cache_key] = (file_id, read_time, entries)
+        if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+            _FILE_CACHE.popitem(last=False)
+    _FILE_CACHE.move_to_end(cache_key)
+
+    return file_format, copy.deepcopy(entries)
+
+
+def _read_file(
+    file_path: pathlib.Path,
+    file_format: str,
+    encoding: str,
+    reader_args: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Read and parse a configuration file
+
+    Readers that can parse an open file are given the file directly, so that the
+    full text does not need to be kept in memory. Other readers are given the
+    text of the file as a string.
+    """
+    from_stream = _get_file_reader(file_format)
+    if from_stream is None:
+        return from_str(
+            file_format, string=file_path.read_text(encoding=encoding), **reader_args
+        )
+
+    with file_path.open(mode="r", encoding=encoding) as fid:
+        return from_stream(fid, **reader_args)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_reader(
+    file_format: str, func: Optional[str] = None
+) -> Callable[..., Dict[str, Any]]:
+    """Look up the reader for the given format, remember it for later"""
+    return get(file_format, func=func)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_file_reader(file_format: str) -> Optional[Callable[..., Dict[str, Any]]]:
+    """Look up the reader of open files for the given format, if there is one"""
+    try:
+        return get(file_format, func=f"from_{file_format}_file")
+    except pyplugs.UnknownPluginFunctionError:
+        return None
@@ -4,7 +4,7 @@
 
 # Standard library imports
 from configparser import ConfigParser
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
 
 # Third party imports
 import pyplugs
@@ -14,6 +14,7 @@ from pyconfs import _converters
 
 # Support type information in ini-files
 _TYPE_SUFFIX = ":type"
+_TYPE_SUFFIX_LENGTH = len(_TYPE_SUFFIX)
 
 
 @pyplugs.register
@@ -21,14 +22,21 @@ def from_ini(string: str, **ini_args: Any) -> Dict[str, Any]:
     """Use ConfigParser to read an ini-file"""
     cfg = ConfigParser(delimiters=("=",), **ini_args)
     cfg.read_string(string)
+    return _as_dict(cfg)
 
-    # Convert to nested dictionary and interpret given types
+
+@pyplugs.register
+def from_ini_file(fid: TextIO, **ini_args: Any) -> Dict[str, Any]:
+    """Use ConfigParser to read an ini-file from an open file, line by line"""
+    cfg = ConfigParser(delimiters=("=",), **ini_args)
+    cfg.read_file(fid)
+    return _as_dict(cfg)
+
+
+def _as_dict(cfg: ConfigParser) -> Dict[str, Any]:
+    """Convert to nested dictionary and interpret given types"""
     return _convert_types(
-        {
-            name: {k: v for k, v in section.items()}
-            for name, section in cfg.items()
-            if not name == "DEFAULT"
-        }
+        {name: dict(section) for name, section in cfg.items() if name != "DEFAULT"}
     )
 
 
@@ -38,22 +46,31 @@ def _convert_types(entries: Dict[str, str]) -> Dict[str, Any]:
     Ini-files by default does not support type information (everything is a
     string) Add possibility to specify types using a special :-syntax (see
     _TYPE_SUFFIX)
+
+    Type information is collected in one pass over all sections before the
+    entries are converted, so that the dictionaries are not changed while they
+    are iterated over. Unknown types raise a ValueError.
     """
-    for key, value in entries.copy().items():
-        # Recursively convert types in subdictionaries
-        if isinstance(value, dict):
-            _convert_types(value)
-            continue
-
-        # Find type information
-        if not key.endswith(_TYPE_SUFFIX):
-            continue
-        master = key.partition(_TYPE_SUFFIX)[0]
-        if master not in entries:
-            continue
-
-        # Convert entry to the given type
-        entries[master] = _converters.convert(f"to_{value}", value=entries[master])
-        del entries[key]
+    conversions = []
+    stack = [entries]
+    while stack:
+        section = stack.pop()
+        for key, value in section.items():
+            # Convert types in subdictionaries as well
+            if isinstance(value, dict):
+                stack.append(value)
+                continue
+
+            # Find type information
+            if not key.endswith(_TYPE_SUFFIX):
+                continue
+            master = key[:-_TYPE_SUFFIX_LENGTH]
+            if master in section:
+                conversions.append((section, master, key))
+
+    # Convert entries to the given types
+    for section, master, key in conversions:
+        dtype = section.pop(key)
+        section[master] = _converters.convert_to(dtype, section[master])
 
     return entries
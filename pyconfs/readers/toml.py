@@ -3,6 +3,7 @@
 """
 
 # Standard library imports
+import sys
 from typing import Any, Dict
 
 # Third party imports
@@ -13,9 +14,17 @@ from pyconfs._util import delayed_import
 
 # Delayed imports
 toml = delayed_import("toml")
+tomllib = delayed_import("tomllib") if sys.version_info >= (3, 11) else None
 
 
 @pyplugs.register
 def from_toml(string: str, **toml_args: Any) -> Dict[str, Any]:
-    """Use toml library to read TOML file"""
+    """Use toml library to read TOML file
+
+    The faster tomllib in the standard library is used when it is available,
+    unless options for the toml library are given.
+    """
+    if tomllib is not None and not toml_args:
+        return tomllib.loads(string)
+
     return toml.loads(string, **toml_args)
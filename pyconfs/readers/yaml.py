@@ -3,7 +3,7 @@
 """
 
 # Standard library imports
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
 
 # Third party imports
 import pyplugs
@@ -18,9 +18,26 @@ yaml = delayed_import("yaml")
 @pyplugs.register
 def from_yaml(string: str, Loader: Any = None, **yaml_args: Any) -> Dict[str, Any]:
     """Use PyYAML library to read YAML file"""
-    Loader = yaml.FullLoader if Loader is None else Loader
+    Loader = _default_loader() if Loader is None else Loader
 
     try:
         return yaml.load(string, Loader=Loader, **yaml_args)
     except yaml.composer.ComposerError:
         return next(yaml.load_all(string, Loader=Loader, **yaml_args))
+
+
+@pyplugs.register
+def from_yaml_file(fid: TextIO, Loader: Any = None, **yaml_args: Any) -> Dict[str, Any]:
+    """Use PyYAML library to read YAML from an open file, parsing it in chunks"""
+    Loader = _default_loader() if Loader is None else Loader
+
+    try:
+        return yaml.load(fid, Loader=Loader, **yaml_args)
+    except yaml.composer.ComposerError:
+        fid.seek(0)
+        return next(yaml.load_all(fid, Loader=Loader, **yaml_args))
+
+
+def _default_loader() -> Any:
+    """Use the libyaml based loader if it is available, it is much faster"""
+    return getattr(yaml, "CFullLoader", yaml.FullLoader)
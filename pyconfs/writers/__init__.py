@@ -3,8 +3,10 @@
 """
 
 # Standard library imports
+import contextlib
+import functools
 import pathlib
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO
 
 # Third party imports
 import pyplugs
@@ -14,6 +16,7 @@ from pyconfs import formats
 
 names = pyplugs.names_factory(__package__)
 as_str = pyplugs.call_factory(__package__)
+get = pyplugs.get_factory(__package__)
 
 
 def as_file(
@@ -26,6 +29,11 @@ def as_file(
     """Write dictionary to file with the given format
 
     If the file format is not specified, it is deduced from the file path suffix.
+
+    Writers that can write to an open file are given the file directly, so that
+    the full text does not need to be kept in memory. Other writers create the
+    text as a string first. The file is only opened once there is something to
+    write, so an existing file is kept if the writer fails before that.
     """
     # Guess format
     file_format = (
@@ -33,7 +41,81 @@ def as_file(
     )
 
     # Write file
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(
-        as_str(file_format, config=config, **writer_args), encoding=encoding
-    )
+    to_stream = _get_file_writer(file_format)
+    if to_stream is None:
+        text = as_str(file_format, config=config, **writer_args)
+        with _open_for_writing(file_path, encoding=encoding) as fid:
+            fid.write(text)
+        return
+
+    with _open_on_first_write(file_path, encoding=encoding) as fid:
+        to_stream(config, fid, **writer_args)
+
+
+def _open_for_writing(file_path: pathlib.Path, encoding: str) -> TextIO:
+    """Open a file for writing, create its directory only if it is missing"""
+    try:
+        return file_path.open(mode="w", encoding=encoding)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        return file_path.open(mode="w", encoding=encoding)
+
+
+class _OpenOnFirstWrite:
+    """Text file that is only opened, and emptied, when it is first written to
+
+    Writers prepare their output before they write anything, so a writer that
+    fails on the configuration leaves an existing file untouched.
+    """
+
+    def __init__(self, file_path: pathlib.Path, encoding: str) -> None:
+        """Remember the file, but do not open it yet"""
+        self.file_path = file_path
+        self.encoding = encoding
+        self._fid: Optional[TextIO] = None
+
+    def open(self) -> TextIO:
+        """Open the file, unless it is already open"""
+        if self._fid is None:
+            self._fid = _open_for_writing(self.file_path, encoding=self.encoding)
+        return self._fid
+
+    def write(self, text: str) -> int:
+        """Write text to the file, opening it first if necessary"""
+        return self.open().write(text)
+
+    def flush(self) -> None:
+        """Flush the file, if it has been opened"""
+        if self._fid is not None:
+            self._fid.flush()
+
+    def close(self) -> None:
+        """Close the file, if it has been opened"""
+        if self._fid is not None:
+            self._fid.close()
+
+
+@contextlib.contextmanager
+def _open_on_first_write(
+    file_path: pathlib.Path, encoding: str
+) -> Iterator[_OpenOnFirstWrite]:
+    """Give writers a file that is opened when they start writing to it
+
+    The file is written in place. If the writer succeeds without writing
+    anything, the file is still created or emptied.
+    """
+    fid = _OpenOnFirstWrite(file_path, encoding=encoding)
+    try:
+        yield fid
+        fid.open()
+    finally:
+        fid.close()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_file_writer(file_format: str) -> Optional[Callable[..., None]]:
+    """Look up the writer to open files for the given format, if there is one"""
+    try:
+        return get(file_format, func=f"as_{file_format}_file")
+    except pyplugs.UnknownPluginFunctionError:
+        return None
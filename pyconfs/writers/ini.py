@@ -6,19 +6,21 @@
 # Standard library imports
 import io
 from configparser import ConfigParser
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
 
 # Third party imports
 import pyplugs
 
+# PyConfs imports
+from pyconfs.configuration import IsConfiguration
+
 _TYPE_SUFFIX = ":type"
 
 
 @pyplugs.register
 def as_ini(config: Dict[str, Any], store_types: bool = False, **ini_args: Any) -> None:
     """Use ConfigParser to write an ini-file"""
-    cfg = ConfigParser(delimiters=("=",))
-    cfg.update(_normalize(config, store_types=store_types))
+    cfg = _config_parser(config, store_types=store_types)
 
     # Write to a string
     with io.StringIO() as string:
@@ -26,17 +28,38 @@ def as_ini(config: Dict[str, Any], store_types: bool = False, **ini_args: Any) -
         return string.getvalue()
 
 
+@pyplugs.register
+def as_ini_file(
+    config: Dict[str, Any], fid: TextIO, store_types: bool = False, **ini_args: Any
+) -> None:
+    """Use ConfigParser to write an ini-file directly to an open file"""
+    cfg = _config_parser(config, store_types=store_types)
+    cfg.write(fid, **ini_args)
+
+
+def _config_parser(config: Dict[str, Any], store_types: bool) -> ConfigParser:
+    """Set up a ConfigParser with the normalized configuration"""
+    cfg = ConfigParser(delimiters=("=",))
+    cfg.update(_normalize(config, store_types=store_types))
+    return cfg
+
+
 def _normalize(config: Dict[str, Any], store_types: bool) -> Dict[str, Dict[str, str]]:
-    """ConfigParser only supports string values and 1 level of nesting"""
+    """ConfigParser only supports string values and 1 level of nesting
+
+    Configurations are converted to plain dictionaries first, so that nested
+    configurations are written the same way as nested dictionaries.
+    """
     if store_types:
         raise NotImplementedError("Handling of types is not implemented in ini-writer")
 
+    if isinstance(config, IsConfiguration):
+        config = config.as_dict()
+
     normalized = {}
     for section_name, section in config.items():
         if isinstance(section, dict):
-            norm_section = normalized.setdefault(section_name, {})
-            for key, entry in section.items():
-                norm_section.update(_as_str(key, entry))
+            _add_entries(normalized.setdefault(section_name, {}), section)
         elif isinstance(section, list):
             raise NotImplementedError(
                 "Ini-writer does not handle top-level list configurations"
@@ -48,14 +71,21 @@ def _normalize(config: Dict[str, Any], store_types: bool) -> Dict[str, Dict[str,
     return normalized
 
 
-def _as_str(key: str, entry: Any) -> Dict[str, str]:
-    """Convert an entry to a string"""
-    if isinstance(entry, dict):
-        values = {}
-        for subkey, subentry in entry.items():
-            values.update(_as_str(f"{key}__{subkey}", subentry))
-        return values
-    elif isinstance(entry, list):
-        return {key: ", ".join(str(item) for item in entry)}
-    else:
-        return {key: str(entry)}
+def _add_entries(values: Dict[str, str], section: Dict[str, Any]) -> None:
+    """Convert entries to strings, flattening nested entries into one level
+
+    Nested dictionaries are walked with an explicit stack, and their keys are
+    joined with double underscores.
+    """
+    stack = list(reversed(list(section.items())))
+    while stack:
+        key, entry = stack.pop()
+        if isinstance(entry, dict):
+            stack.extend(
+                (f"{key}__{subkey}", subentry)
+                for subkey, subentry in reversed(list(entry.items()))
+            )
+        elif isinstance(entry, list):
+            values[key] = ", ".join(str(item) for item in entry)
+        else:
+            values[key] = str(entry)
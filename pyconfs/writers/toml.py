@@ -20,17 +20,58 @@ toml = delayed_import("toml")
 def as_toml(
     config: Dict[str, Any], pretty_print: bool = False, **toml_args: Any
 ) -> None:
-    """Use toml library to write TOML file"""
+    """Use toml library to write TOML file
+
+    Unnamed configurations are pretty printed directly, other data are first
+    converted to a Configuration.
+    """
     config_with_str_keys = _enforce_str_keys(config)
 
     if pretty_print:
-        return Configuration.from_dict(config_with_str_keys).as_str(**toml_args)
+        if not _is_unnamed_configuration(config_with_str_keys):
+            config_with_str_keys = Configuration.from_dict(config_with_str_keys)
+        return config_with_str_keys.as_str(**toml_args)
     else:
         return toml.dumps(config_with_str_keys, **toml_args)
 
 
+def _is_unnamed_configuration(data: Dict[str, Any]) -> bool:
+    """Check if data is a configuration that is printed without section names"""
+    return isinstance(data, Configuration) and data.name is None
+
+
 def _enforce_str_keys(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Changes keys in nested dicts to strings."""
+    """Changes keys in nested dicts to strings.
+
+    Data where all keys already are strings are returned as they are. Otherwise,
+    nested lists are copied as well, so that the result only contains plain
+    dictionaries and lists.
+    """
+    if not _has_non_str_keys(data):
+        return data
+
+    return _str_keys(data)
+
+
+def _has_non_str_keys(data: Any) -> bool:
+    """Check if any nested dict has keys that are not strings"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if not all(type(key) is str for key in value):
+                return True
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+    return False
+
+
+def _str_keys(data: Any) -> Any:
+    """Copy nested dicts and lists, changing keys to strings"""
     if isinstance(data, dict):
-        return {str(key): _enforce_str_keys(value) for key, value in data.items()}
+        return {str(key): _str_keys(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_str_keys(value) for value in data]
     return data
@@ -3,13 +3,14 @@
 """
 
 # Standard library imports
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
 
 # Third party imports
 import pyplugs
 
 # PyConfs imports
 from pyconfs._util import delayed_import
+from pyconfs.configuration import IsConfiguration
 
 # Delayed imports
 yaml = delayed_import("yaml")
@@ -17,5 +18,27 @@ yaml = delayed_import("yaml")
 
 @pyplugs.register
 def as_yaml(config: Dict[str, Any], **yaml_args: Any) -> str:
-    """Use PyYAML library to write YAML file"""
-    return yaml.dump(config, **yaml_args)
+    """Use PyYAML library to write YAML file
+
+    PyYAML does not represent subclasses of dict and list, so configurations are
+    converted to plain dictionaries first.
+    """
+    yaml_args.setdefault("Dumper", _default_dumper())
+    return yaml.dump(_as_dict(config), **yaml_args)
+
+
+@pyplugs.register
+def as_yaml_file(config: Dict[str, Any], fid: TextIO, **yaml_args: Any) -> None:
+    """Use PyYAML library to write YAML directly to an open file"""
+    yaml_args.setdefault("Dumper", _default_dumper())
+    yaml.dump(_as_dict(config), fid, **yaml_args)
+
+
+def _as_dict(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert configurations to plain dictionaries and lists"""
+    return config.as_dict() if isinstance(config, IsConfiguration) else config
+
+
+def _default_dumper() -> Any:
+    """Use the libyaml based dumper if it is available, it is much faster"""
+    return getattr(yaml, "CDumper", yaml.Dumper)
@@ -1,14 +1,16 @@
 """Test Configuration object"""
 
 # Standard library imports
+import copy
 import pathlib
+import pickle
 
 # Third party imports
 import pytest
 
 # PyConfs imports
 from pyconfs import _exceptions
-from pyconfs.configuration import ConfigurationList
+from pyconfs.configuration import Configuration, ConfigurationList
 
 
 def test_replace(cfg):
@@ -95,3 +97,311 @@ def test_plain_list_is_python_list(cfg):
 def test_nested_list_is_configlist(cfg):
     """Test that nested lists are represented as ConfigurationList objects"""
     assert isinstance(cfg.dependencies, ConfigurationList)
+
+
+def test_update_wraps_sections(cfg):
+    """Test that dictionaries added with update are treated as sections"""
+    cfg.update({"license": {"short": "MIT"}})
+    assert isinstance(cfg.license, Configuration)
+    assert cfg.license.short == "MIT"
+
+
+def test_setdefault_wraps_sections(cfg):
+    """Test that dictionaries added with setdefault are treated as sections"""
+    section = cfg.setdefault("license", {"short": "MIT"})
+    assert isinstance(section, Configuration)
+    assert cfg.setdefault("license", {"short": "GPL"}).short == "MIT"
+
+
+def test_as_str_indents_sections():
+    """Test that nested sections are indented in the string representation"""
+    cfg = Configuration.from_dict({"a": 1, "b": {"c": "x", "d": {"e": True}}})
+    expected = "\n".join(
+        [
+            "a    = 1",
+            "",
+            "  [b]",
+            '  c    = "x"',
+            "",
+            "    [b.d]",
+            "    e    = true",
+        ]
+    )
+    assert cfg.as_str(key_width=4) == expected
+
+
+def test_from_dict_keeps_order():
+    """Test that entries keep their order when sections and values are mixed"""
+    entries = {"b": 1, "a": {"c": 2}, "d": 3, "e": [{"f": 4}], "g": 5}
+    cfg = Configuration.from_dict(entries)
+    assert list(cfg) == list(entries)
+    assert cfg.as_dict() == entries
+
+
+def test_entry_keys_follow_updates(cfg):
+    """Test that entry and section keys are updated when entries change"""
+    assert "version" not in cfg.entry_keys
+    cfg.version = "0.5.5"
+    assert "version" in cfg.entry_keys
+
+    cfg.license = {"short": "MIT"}
+    assert "license" in cfg.section_names
+
+    del cfg["version"]
+    assert "version" not in cfg.entry_keys
+
+
+def test_leafs_keep_order():
+    """Test that leafs are listed in order, including nested entries"""
+    cfg = Configuration.from_dict({"a": 1, "b": {"c": 2, "d": [{"e": 3}]}, "f": 4})
+    assert cfg.leaf_values == [1, 2, 3, 4]
+
+
+def test_get_nested_key(cfg):
+    """Test that nested keys can be looked up with a list"""
+    assert cfg.get(["author", "lastname"]) == "Hjelle"
+    assert cfg.get(["author", "country", "name"], "Norway") == "Norway"
+
+
+def test_get_nested_key_through_list(cfg):
+    """Test that nested keys can be looked up through a ConfigurationList"""
+    assert cfg.get(["dependencies", 1, "name"]) == "pyplugs"
+
+
+def test_get_nested_key_strict(cfg):
+    """Test that strict lookup of nested keys raises an error for missing keys"""
+    with pytest.raises(KeyError):
+        cfg.get(["author", "country"], strict=True)
+
+
+def test_from_dict_deeply_nested():
+    """Test that deeply nested dictionaries are loaded with names and sources"""
+    entries = value = {}
+    for level in range(2000):
+        value = value.setdefault(f"level{level}", {"number": level})
+    cfg = Configuration.from_dict(entries, name="deep", source="test")
+    section = cfg
+    for level in range(2000):
+        section = section[f"level{level}"]
+    assert section.number == 1999
+    assert section.name.endswith(".level1998.level1999")
+    assert section._source["number"] == "test"
+
+
+def test_list_of_scalars_is_entry():
+    """Test that lists of plain values are stored as entries, not sections"""
+    cfg = Configuration.from_dict({"numbers": [1, 2.5, "three", None]})
+    assert cfg.entry_keys == ["numbers"]
+    assert cfg.numbers == [1, 2.5, "three", None]
+
+
+def test_list_with_nested_value_is_section():
+    """Test that a nested value anywhere in a list makes it a section"""
+    cfg = Configuration.from_dict({"items": [1, 2, {"three": 3}]})
+    assert isinstance(cfg["items"], ConfigurationList)
+
+
+def test_replace_nested_variables():
+    """Test that variables can refer to other variables"""
+    cfg = Configuration.from_dict({"path": "{root}/{name}.txt"})
+    replaced = cfg.replace("path", root="{home}/data", name="{home}", home="/home")
+    assert replaced == "/home/data//home.txt"
+
+
+def test_replace_circular_variables():
+    """Test that variables referring to themselves are left unreplaced"""
+    cfg = Configuration.from_dict({"path": "{one}"})
+    assert cfg.replace("path", one="{two}", two="{one}") == "{one}"
+
+
+def test_replace_variable_with_closing_braces():
+    """Test that escaped closing braces in variables are unescaped when replaced"""
+    cfg = Configuration.from_dict({"text": "{x}"})
+    assert cfg.replace("text", x="a}}b") == "a}b"
+
+
+def test_replace_variable_with_single_closing_brace():
+    """Test that a single closing brace in a variable is reported as an error"""
+    cfg = Configuration.from_dict({"text": "{x}"})
+    with pytest.raises(ValueError):
+        cfg.replace("text", x="a}b")
+
+
+def test_sources_nested():
+    """Test that sources are collected from sections and configuration lists"""
+    cfg = Configuration.from_dict({"one": 1, "section": {"two": 2}}, source="first")
+    cfg.update_from_dict({"items": [[{"three": 3}], 4]}, source="second")
+    cfg.section.update_entry("five", 5, source="third")
+    assert cfg.sources == {"first", "second", "third"}
+    assert cfg.get_source("section") == {"first", "third"}
+
+
+def test_replace_dedent():
+    """Test that indented values can be dedented when replaced"""
+    cfg = Configuration.from_dict({"text": "\n    {greeting}\n      world\n"})
+    assert cfg.replace("text", dedent=True, greeting="hello") == "\nhello\n  world\n"
+
+
+def test_update_from_env(monkeypatch):
+    """Test that entries can be read from environment variables"""
+    monkeypatch.setenv("PYCONFS_HOST", "example.com")
+    monkeypatch.setenv("PYCONFS_PORT", "8080")
+    cfg = Configuration.from_dict({"server": {"host": "localhost"}})
+    cfg.update_from_env(
+        {"HOST": ["server", "host"], "PORT": ["server", "port"], "USER": ["user"]},
+        converters={"PORT": "int"},
+        prefix="PYCONFS_",
+    )
+    assert cfg.server.as_dict() == {"host": "example.com", "port": 8080}
+    assert "user" not in cfg
+    assert cfg.server.get_source("port") == "PYCONFS_PORT (environment variable)"
+
+
+def test_as_str_configuration_list():
+    """Test that configuration lists inside sections are indented"""
+    cfg = Configuration.from_dict({"sec": {"items": [{"one": 1}, "two"]}}, name="top")
+    expected = [
+        "[top]",
+        "",
+        "  [top.sec]",
+        "",
+        "    [[top.sec.items]]",
+        "    one                  = 1",
+        "",
+        "    [[top.sec.items]]",
+        '    "two"',
+    ]
+    assert cfg.as_str().splitlines() == expected
+
+
+def test_configuration_list_is_list():
+    """Test that configuration lists behave as regular lists"""
+    cfg = Configuration.from_dict({"items": [{"one": 1}, {"one": 2}]})
+    assert isinstance(cfg["items"], list)
+    assert cfg["items"].is_list
+    assert cfg["items"].one == [1, 2]
+    assert [item.one for item in cfg["items"][1:]] == [2]
+
+
+def test_name_stem_follows_name():
+    """Test that name stem and section names follow changes to the name"""
+    cfg = Configuration.from_dict({"section": {"key": 1}})
+    assert cfg.name_stem == ""
+    assert cfg.section.name == "section"
+    cfg.name = "top.config"
+    cfg.update_from_dict({"other": {"key": 2}})
+    assert cfg.name_stem == "config"
+    assert cfg.other.name == "top.config.other"
+    assert cfg.other.name_stem == "other"
+
+
+def test_replace_without_variables():
+    """Test that values without variables are returned unchanged"""
+    cfg = Configuration.from_dict({"plain": "no variables", "braces": "{{x}}"})
+    assert cfg.replace("plain", unused="value") == "no variables"
+    assert cfg.replace("braces") == "{x}"
+
+
+def test_sources_follow_changes():
+    """Test that cached sources are updated when sections change"""
+    cfg = Configuration.from_dict({"a": {"b": [{"c": 1}]}}, source="first")
+    assert cfg.sources == {"first"}
+    cfg.a.b[0].update_entry("d", 2, source="second")
+    assert cfg.sources == {"first", "second"}
+    assert cfg.a.sources == {"first", "second"}
+    del cfg["a"]
+    assert cfg.sources == set()
+
+
+def test_replace_overrides_vars():
+    """Test that variables given to replace take precedence over stored vars"""
+    cfg = Configuration.from_dict({"greeting": "Hello {name}"})
+    cfg.vars["name"] = "world"
+    assert cfg.replace("greeting") == "Hello world"
+    assert cfg.replace("greeting", name="there") == "Hello there"
+
+
+def test_update_replaces_plain_value_with_section():
+    """Test that nested values can replace plain values"""
+    cfg = Configuration.from_dict({"a": 1, "b": 2}, source="first")
+    cfg.update_from_dict({"a": {"c": 3}, "b": [{"d": 4}]}, source="second")
+    assert cfg.a.c == 3
+    assert cfg.b[0].d == 4
+    assert cfg.section_names == ["a", "b"]
+    assert cfg.sources == {"second"}
+
+
+def test_section_with_int_key():
+    """Test that sections can have keys that are not strings"""
+    cfg = Configuration.from_dict({1: {"a": 1}})
+    assert cfg[1].a == 1
+    assert cfg[1].name_stem == "1"
+
+
+def test_copy_is_configuration():
+    """Test that copies are independent configurations that keep their sources"""
+    cfg = Configuration.from_dict({"a": 1, "s": {"x": 2}}, name="cfg", source="src")
+    copied = cfg.copy()
+    assert isinstance(copied, Configuration)
+    assert copied.name == "cfg"
+    assert copied.as_dict() == cfg.as_dict()
+    assert copied.get_source("a") == "src"
+
+    copied.s.x = 3
+    assert cfg.s.x == 2
+
+
+def test_or_returns_configuration():
+    """Test that the | operator returns new configurations"""
+    cfg = Configuration.from_dict({"a": 1, "s": {"x": 2}})
+    merged = cfg | {"b": {"y": 3}}
+    assert isinstance(merged, Configuration)
+    assert isinstance(merged.b, Configuration)
+    assert merged.section_names == ["s", "b"]
+    assert cfg.section_names == ["s"]
+
+    reversed_merged = {"a": 0, "c": 4} | cfg
+    assert isinstance(reversed_merged, Configuration)
+    assert reversed_merged.as_dict() == {"a": 1, "c": 4, "s": {"x": 2}}
+
+
+def test_ior_updates_configuration():
+    """Test that the |= operator updates entries and sections"""
+    cfg = Configuration.from_dict({"a": 1})
+    assert cfg.entry_keys == ["a"]
+    cfg |= {"b": 2, "s": {"x": 3}}
+    assert isinstance(cfg, Configuration)
+    assert cfg.entry_keys == ["a", "b"]
+    assert isinstance(cfg.s, Configuration)
+
+
+def test_no_instance_dict():
+    """Test that configurations and configuration lists store attributes in slots"""
+    cfg = Configuration.from_dict({"numbers": [{"one": 1}, {"two": 2}]})
+    assert not hasattr(cfg, "__dict__")
+    assert not hasattr(cfg.numbers, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "copy_func",
+    [copy.copy, copy.deepcopy, lambda cfg: pickle.loads(pickle.dumps(cfg))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_copy_and_pickle_roundtrip(copy_func):
+    """Test that copied and pickled configurations keep their sources"""
+    cfg = Configuration.from_dict(
+        {"a": 1, "s": {"items": [{"x": 1}, {"x": 2}]}}, name="cfg", source="first"
+    )
+    cfg.s.update_entry("b", 2, source="second")
+    copied = copy_func(cfg)
+
+    assert isinstance(copied, Configuration)
+    assert copied.name == "cfg"
+    assert copied.as_dict() == cfg.as_dict()
+    assert copied.sources == {"first", "second"}
+    assert copied.s.get_source("b") == "second"
+    assert copied.s._parent is copied
+    assert isinstance(copied.s["items"], ConfigurationList)
+
+    copied.s.b = 3
+    assert cfg.s.b == 2
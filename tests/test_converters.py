@@ -0,0 +1,106 @@
+"""Test conversion of strings to other datatypes"""
+
+# Standard library imports
+import pathlib
+from datetime import date, datetime
+
+# Third party imports
+import pytest
+
+# PyConfs imports
+from pyconfs import _converters, _exceptions, convert_to
+
+
+def test_to_list():
+    """Test that a string can be converted to a list"""
+    assert _converters.to_list("one, two three") == ["one", "two", "three"]
+
+
+def test_to_list_custom_split():
+    """Test that a custom regular expression can be used to split a list"""
+    expected = ["one", "two three"]
+    assert _converters.to_list("one;two three", split_re=";") == expected
+
+
+def test_to_list_converter():
+    """Test that list elements can be converted"""
+    assert _converters.to_list("1, 2, 3", converter=int) == [1, 2, 3]
+
+
+def test_to_set():
+    """Test that a string can be converted to a set"""
+    assert _converters.to_set("one, two, one") == {"one", "two"}
+
+
+def test_to_tuple():
+    """Test that a string can be converted to a tuple"""
+    assert _converters.to_tuple("1 2", converter=float) == (1.0, 2.0)
+
+
+def test_to_dict():
+    """Test that a string can be converted to a dictionary"""
+    expected = {"one": "1", "two": "2"}
+    assert _converters.to_dict("one: 1,\ntwo: 2") == expected
+
+
+def test_to_bool():
+    """Test that strings can be converted to booleans"""
+    assert _converters.to_bool("Yes") is True
+    assert _converters.to_bool("off") is False
+    assert _converters.to_bool(True) is True
+
+
+def test_to_bool_invalid():
+    """Test that invalid booleans raise a proper error"""
+    with pytest.raises(_exceptions.ConversionError):
+        _converters.to_bool("maybe")
+
+
+def test_convert_to():
+    """Test that convert_to dispatches to the correct converter"""
+    assert convert_to("int", "42") == 42
+
+
+def test_convert_to_unknown():
+    """Test that convert_to raises a proper error for unknown types"""
+    with pytest.raises(ValueError):
+        convert_to("unknown", "42")
+
+
+def test_to_list_max_split():
+    """Test that the number of splits can be limited"""
+    assert _converters.to_list("one two three", max_split=1) == ["one", "two three"]
+
+
+def test_to_list_unicode_whitespace():
+    """Test that the default separator splits on Unicode whitespace as well"""
+    assert _converters.to_list("one\ttwo\u00a0three,,four\u2003five") == [
+        "one",
+        "two",
+        "three",
+        "four",
+        "five",
+    ]
+
+
+def test_to_dict_custom_split():
+    """Test that dictionary items can be split by a custom regular expression"""
+    expected = {"one": "1", "two": "2"}
+    assert _converters.to_dict("one: 1;two: 2", item_split_re=";") == expected
+
+
+def test_to_date():
+    """Test that a string can be converted to a date"""
+    assert _converters.to_date("2021-10-20") == date(2021, 10, 20)
+
+
+def test_to_datetime_format():
+    """Test that a custom format can be used when converting to a datetime"""
+    value = _converters.to_datetime("20.10.2021 12:30", format="%d.%m.%Y %H:%M")
+    assert value == datetime(2021, 10, 20, 12, 30)
+
+
+def test_to_path():
+    """Test that strings can be converted to paths"""
+    assert _converters.to_path("dir/file.txt") == pathlib.Path("dir/file.txt")
+    assert _converters.to_path("~/file.txt") == pathlib.Path.home() / "file.txt"
@@ -1,13 +1,24 @@
 """Test reading of configuration files"""
 
 # Standard library imports
+import io
+import os
 import pathlib
+import threading
+from collections import OrderedDict
 
 # Third party imports
 import pytest
 
 # PyConfs imports
-from pyconfs import Configuration
+from pyconfs import Configuration, readers
+from pyconfs._exceptions import UnknownFormat
+
+
+@pytest.fixture(autouse=True)
+def empty_file_cache(monkeypatch):
+    """Start each test with an empty file cache"""
+    monkeypatch.setattr(readers, "_FILE_CACHE", OrderedDict())
 
 
 @pytest.fixture
@@ -66,6 +77,41 @@ def test_ini_handle_int_key_gracefully(cfg_with_int_key):
     # assert roundtripped.long_answer.parts.entry_keys == ["1", "2"]
 
 
+def test_write_ini_list_of_dicts(tmp_path):
+    """Test that lists of dictionaries inside a section are written as plain values"""
+    cfg = Configuration.from_dict({"section": {"items": [{"one": 1}, "two"]}})
+    expected = "[section]\nitems = {'one': 1}, two\n\n"
+    assert cfg.as_str(format="ini") == expected
+
+    cfg_path = tmp_path / "list_of_dicts.ini"
+    cfg.as_file(cfg_path)
+    assert cfg_path.read_text() == expected
+
+
+def test_read_ini_types():
+    """Test that ini entries are converted to the types given in the file"""
+    cfg = Configuration.from_str(
+        "[section]\nnumber = 42\nnumber:type = int\n", format="ini"
+    )
+    assert cfg.section.as_dict() == {"number": 42}
+
+
+def test_read_ini_unknown_type():
+    """Test that an unknown type in an ini-file raises a ValueError"""
+    with pytest.raises(ValueError, match="unknown"):
+        Configuration.from_str(
+            "[section]\nnumber = 42\nnumber:type = unknown\n", format="ini"
+        )
+
+
+def test_read_with_reader_function():
+    """Test that other functions in a reader plugin can be called"""
+    entries = readers.from_str(
+        "ini", func="from_ini_file", fid=io.StringIO("[section]\nanswer = 42\n")
+    )
+    assert entries == {"section": {"answer": "42"}}
+
+
 def test_read_json(sample_dir):
     """Test that reading an JSON file succeeds"""
     Configuration.from_file(sample_dir / "sample.json")
@@ -117,6 +163,14 @@ def test_toml_roundtrip(cfg):
     assert roundtripped.as_dict() == cfg.as_dict()
 
 
+def test_toml_pretty_print(cfg):
+    """Test that pretty printed TOML does not depend on the configuration name"""
+    unnamed = Configuration.from_dict(cfg.as_dict())
+    expected = unnamed.as_str()
+    assert unnamed.as_str(format="toml", pretty_print=True) == expected
+    assert cfg.as_str(format="toml", pretty_print=True) == expected
+
+
 def test_toml_handle_int_key_gracefully(cfg_with_int_key):
     """Test that TOML format handles int keys gracefully"""
     roundtripped = Configuration.from_str(
@@ -156,3 +210,138 @@ def test_yaml_handle_int_key_gracefully(cfg_with_int_key):
 
     # YAML supports integer keys
     assert roundtripped.as_dict() == cfg_with_int_key.as_dict()
+
+
+def test_guess_unknown_format(tmp_path):
+    """Test that reading a file with an unknown suffix raises a proper error"""
+    cfg_path = tmp_path / "sample.unknown"
+    cfg_path.write_text("answer = 42")
+    with pytest.raises(UnknownFormat):
+        Configuration.from_file(cfg_path)
+
+
+def test_read_yaml_multiple_documents(tmp_path):
+    """Test that the first document is used when a YAML file has several"""
+    cfg_path = tmp_path / "documents.yaml"
+    cfg_path.write_text("answer: 42\n---\nanswer: 43\n")
+    assert Configuration.from_file(cfg_path).answer == 42
+
+
+def test_write_yaml_configuration_list():
+    """Test that configuration lists are written as plain YAML lists"""
+    cfg = Configuration.from_dict({"items": [{"one": 1}, {"two": 2}]})
+    assert cfg.as_str(format="yaml") == "items:\n- one: 1\n- two: 2\n"
+
+
+def test_read_cached_file(tmp_path):
+    """Test that cached files are copied, and read again when changed"""
+    cfg_path = tmp_path / "cached.yaml"
+    cfg_path.write_text("numbers: [1, 2]")
+    os.utime(cfg_path, (0, 0))
+
+    cfg = Configuration.from_file(cfg_path, cache=True)
+    cfg.numbers.append(3)
+    assert Configuration.from_file(cfg_path, cache=True).numbers == [1, 2]
+
+    cfg_path.write_text("numbers: [4, 5, 6]")
+    os.utime(cfg_path, (0, 0))
+    assert Configuration.from_file(cfg_path, cache=True).numbers == [4, 5, 6]
+
+
+def test_read_file_without_cache(tmp_path):
+    """Test that files are not cached by default"""
+    cfg_path = tmp_path / "uncached.yaml"
+    cfg_path.write_text("number: 1")
+    os.utime(cfg_path, (0, 0))
+    assert Configuration.from_file(cfg_path, cache=True).number == 1
+
+    cfg_path.write_text("number: 2")
+    os.utime(cfg_path, (0, 0))
+    assert Configuration.from_file(cfg_path).number == 2
+
+
+def test_file_cache_is_bounded(tmp_path):
+    """Test that the least recently used files are dropped from the cache"""
+    first_path = tmp_path / "first.yaml"
+    first_path.write_text("number: 0")
+    os.utime(first_path, (0, 0))
+    Configuration.from_file(first_path, cache=True)
+
+    for number in range(readers._FILE_CACHE_SIZE):
+        cfg_path = tmp_path / f"file_{number}.yaml"
+        cfg_path.write_text(f"number: {number}")
+        os.utime(cfg_path, (0, 0))
+        Configuration.from_file(cfg_path, cache=True)
+
+    assert len(readers._FILE_CACHE) == readers._FILE_CACHE_SIZE
+    assert all(key[0] != first_path for key in readers._FILE_CACHE)
+
+
+@pytest.mark.parametrize("file_format", ["ini", "json", "yaml"])
+def test_write_file(tmp_path, file_format):
+    """Test that configurations written to file match their string representation"""
+    cfg = Configuration.from_dict({"section": {"answer": 42, "items": [1, 2]}})
+    cfg_path = tmp_path / "new_directory" / f"written.{file_format}"
+    cfg.as_file(cfg_path)
+    assert cfg_path.read_text() == cfg.as_str(format=file_format)
+
+
+@pytest.mark.parametrize(
+    "file_format, entries, error",
+    [
+        ("ini", {"items": [1, 2]}, NotImplementedError),
+        ("yaml", {"lock": threading.Lock()}, TypeError),
+    ],
+)
+def test_failed_write_keeps_file(tmp_path, file_format, entries, error):
+    """Test that an existing file is left untouched when writing fails"""
+    cfg_path = tmp_path / f"existing.{file_format}"
+    cfg_path.write_text("original content")
+    with pytest.raises(error):
+        Configuration.from_dict(entries).as_file(cfg_path)
+
+    assert cfg_path.read_text() == "original content"
+    assert list(tmp_path.iterdir()) == [cfg_path]
+
+
+def test_write_file_in_place(tmp_path):
+    """Test that files are written in place, so that hard links see the update"""
+    cfg_path = tmp_path / "original.yaml"
+    cfg_path.write_text("answer: 41\n")
+    link_path = tmp_path / "link.yaml"
+    os.link(cfg_path, link_path)
+
+    Configuration.from_dict({"answer": 42}).as_file(cfg_path)
+    assert link_path.read_text() == "answer: 42\n"
+
+
+def test_json_is_not_cached(tmp_path):
+    """Test that JSON files are not cached, as they are parsed faster than copied"""
+    cfg_path = tmp_path / "uncached.json"
+    cfg_path.write_text('{"number": 1}')
+    os.utime(cfg_path, (0, 0))
+
+    assert Configuration.from_file(cfg_path, cache=True).number == 1
+    assert not readers._FILE_CACHE
+
+
+@pytest.mark.parametrize("file_format", ["ini", "toml", "yaml"])
+def test_cached_file_is_parsed_once(monkeypatch, tmp_path, file_format):
+    """Test that a cached file is not parsed again when it is read again"""
+    cfg = Configuration.from_dict({"section": {"text": "cached"}})
+    cfg_path = tmp_path / f"cached.{file_format}"
+    cfg.as_file(cfg_path)
+    os.utime(cfg_path, (0, 0))
+
+    read_file = readers._read_file
+    parsed = []
+
+    def counting_read_file(*args, **kwargs):
+        """Count how often the file is parsed"""
+        parsed.append(args)
+        return read_file(*args, **kwargs)
+
+    monkeypatch.setattr(readers, "_read_file", counting_read_file)
+    for _ in range(2):
+        assert Configuration.from_file(cfg_path, cache=True).section.text == "cached"
+    assert len(parsed) == 1
@@ -133,3 +133,27 @@ def test_named_tuple_with_generics(sample_cfg):
 
     author = sample_cfg.author.as_named_tuple(Author)
     assert author.lastname == "Hjelle"
+
+
+def test_named_tuple_with_wrong_type_in_other_field(sample_cfg):
+    """Test that errors in other fields report the value as the source"""
+
+    class Author(NamedTuple):
+        """Author template"""
+
+        firstname: str
+        lastname: str
+        country: str
+
+    with pytest.raises(TypeError) as err:
+        sample_cfg.author.as_named_tuple(Author, country=47)
+
+    assert str(err.value).endswith("(country=47)")
+
+
+def test_named_tuple_template_is_reused(sample_cfg):
+    """Test that the same template is used for configurations with equal fields"""
+    first = sample_cfg.author.as_named_tuple()
+    second = sample_cfg.author.as_named_tuple()
+    assert type(first) is type(second)
+    assert type(first) is not type(sample_cfg.author.as_named_tuple(extra=1))